@@ -60,19 +60,28 @@ class ArgumentParser(object):
             bool: self.parse_bool
         }
 
-    def parse(self, arg_type, value):
-        """Parses the `value` to `arg_type` using the appropriate parser."""
-        if arg_type not in self._parsers:
-            if hasattr(arg_type, 'parse'):
-                return arg_type.parse(value)
-
-            raise DefinitionError(
-                "Argument parser for '{}' is not defined".format(
-                    arg_type
-                )
+    def resolve(self, arg_type):
+        """
+        Returns the parser function for `arg_type`.
+
+        The returned function accepts the raw value only, so callers parsing
+        the same type repeatedly can resolve it once and call it directly.
+        """
+        if arg_type in self._parsers:
+            return self._parsers[arg_type]
+
+        if hasattr(arg_type, 'parse'):
+            return arg_type.parse
+
+        raise DefinitionError(
+            "Argument parser for '{}' is not defined".format(
+                arg_type
             )
+        )
 
-        return self._parsers[arg_type](value)
+    def parse(self, arg_type, value):
+        """Parses the `value` to `arg_type` using the appropriate parser."""
+        return self.resolve(arg_type)(value)
 
     @classmethod
     def parse_int(cls, value):
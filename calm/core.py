@@ -3,6 +3,7 @@ Here lies the core of Calm.
 """
 import re
 from collections import defaultdict
+from functools import lru_cache
 from inspect import cleandoc
 
 from tornado.web import Application
@@ -39,7 +40,8 @@ class CalmApp(object):
                      Application instance
     """
     URI_REGEX = re.compile(r'\{([^\/\?\}]*)\}')
-    config = {  # The default configuration
+    PATH_ARG_GROUP = r'(?P<{}>[^\/\?]*)'  # the regex a path argument becomes
+    DEFAULT_CONFIG = {
         'argument_parser': ArgumentParser,
         'error_key': 'error',
         'swagger_url': '/swagger.json'
@@ -51,10 +53,12 @@ class CalmApp(object):
         super(CalmApp, self).__init__()
 
         self._app = None
-        self._route_map = defaultdict(dict)
+        self._route_map = {}
         self._custom_handlers = []
         self._ws_map = {}
 
+        self.config = dict(self.DEFAULT_CONFIG)
+
         self.name = name
         self.version = version
         self.description = description
@@ -102,21 +106,23 @@ class CalmApp(object):
         """
         self.config.update(kwargs)
 
+    @property
+    def error_key(self):
+        """The key of the error message in error responses."""
+        return self.config['error_key']
+
     def make_app(self):
         """Compiles and returns a Tornado Application instance."""
         route_defs = []
 
         default_handler_args = {
             'argument_parser': self.config.get('argument_parser',
-                                               ArgumentParser),
+                                               ArgumentParser)(),
             'app': self
         }
 
         for uri, methods in self._route_map.items():
-            init_params = {
-                **methods,  # noqa
-                **default_handler_args  # noqa
-            }
+            init_params = dict(methods, **default_handler_args)
 
             route_defs.append(
                 (self._regexify_uri(uri), MainHandler, init_params)
@@ -176,17 +182,30 @@ class CalmApp(object):
 
         return uri
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _parse_uri(cls, uri):
+        """
+        Convert a URL pattern into a regex in a single pass.
+
+        Returns the regex together with the tuple of path argument names.
+        The result is cached, so duplicate registrations share it.
+        """
+        path_params = []
+
+        def to_group(match):
+            """Records the path argument and returns its named group."""
+            path_param = match.group(1)
+            path_params.append(path_param)
+            return cls.PATH_ARG_GROUP.format(path_param)
+
+        uri_regex = cls.URI_REGEX.sub(to_group, uri + '/?')
+
+        return uri_regex, tuple(path_params)
+
     def _regexify_uri(self, uri):
         """Convert a URL pattern into a regex."""
-        uri += '/?'
-        path_params = self.URI_REGEX.findall(uri)
-        for path_param in path_params:
-            uri = uri.replace(
-                '{{{}}}'.format(path_param),
-                r'(?P<{}>[^\/\?]*)'.format(path_param)
-            )
-
-        return uri
+        return self._parse_uri(uri)[0]
 
     def _add_route(self, http_method, function, *uri_fragments,
                    consumes=None, produces=None):
@@ -202,16 +221,16 @@ class CalmApp(object):
             * produces - a Resource type of what the operation produces
         """
         uri = self._normalize_uri(*uri_fragments)
-        uri_regex = self._regexify_uri(uri)
-        handler_def = HandlerDef(uri, uri_regex, function)
+        uri_regex, path_arg_names = self._parse_uri(uri)
+        handler_def = HandlerDef(uri, uri_regex, path_arg_names, function)
 
-        consumes = getattr(function, 'consumes', consumes)
-        produces = getattr(function, 'produces', produces)
-        handler_def.consumes = consumes
-        handler_def.produces = produces
+        attributes = function.__dict__
+        handler_def.consumes = attributes.get('consumes', consumes)
+        handler_def.produces = attributes.get('produces', produces)
+        handler_def.dispatch = MainHandler.compile_dispatcher(handler_def)
 
         function.handler_def = handler_def
-        self._route_map[uri][http_method.lower()] = handler_def
+        self._route_map.setdefault(uri, {})[http_method.lower()] = handler_def
 
     def _decorator(self, http_method, *uri,
                    consumes=None, produces=None):
@@ -344,8 +363,8 @@ class CalmApp(object):
         return {
             'Error': {
                 'properties': {
-                    self.config['error_key']: {'type': 'string'}
+                    self.error_key: {'type': 'string'}
                 },
-                'required': [self.config['error_key']]
+                'required': [self.error_key]
             }
         }
@@ -13,9 +13,11 @@ import inspect
 from inspect import Parameter
 import logging
 import datetime
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import islice
 
 from tornado.web import RequestHandler
-from tornado.web import MissingArgumentError
 
 from untt.util import parse_docstring
 from untt.ex import ValidationError
@@ -26,6 +28,20 @@ from calm.param import QueryParam, PathParam
 
 __all__ = ['MainHandler', 'DefaultHandler']
 
+# Bound once, so the request path skips the `json` module attribute lookups.
+_loads = json.loads
+
+
+def _dumps(obj):
+    """Serializes `obj` to JSON `bytes`."""
+    return json.dumps(obj).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _server_error_payload(error_key):
+    """Returns the serialized server error response body for `error_key`."""
+    return _dumps({error_key: MainHandler.SERVER_ERROR_MESSAGE})
+
 
 class MainHandler(RequestHandler):
     """
@@ -37,6 +53,8 @@ class MainHandler(RequestHandler):
     handlers based on their definitions and request itself.
     """
     BUILTIN_TYPES = (str, list, tuple, set, int, float, datetime.datetime)
+    SERVER_ERROR_MESSAGE = 'Oops our bad. We are working to fix this!'
+    log = logging.getLogger('calm')
 
     def __init__(self, *args, **kwargs):
         """
@@ -45,7 +63,7 @@ class MainHandler(RequestHandler):
         Arguments:
             * get, post, put, delete - appropriate HTTP method handler for
                                        a specific URI
-            * argument_parser - a `calm.ArgumentParser` subclass
+            * argument_parser - a `calm.ArgumentParser` (or subclass) instance
             * app - the Calm application
         """
         self._get_handler = kwargs.pop('get', None)
@@ -53,45 +71,53 @@ class MainHandler(RequestHandler):
         self._put_handler = kwargs.pop('put', None)
         self._delete_handler = kwargs.pop('delete', None)
 
-        self._argument_parser = kwargs.pop('argument_parser')()
+        self._argument_parser = kwargs.pop('argument_parser')
         self._app = kwargs.pop('app')
 
-        self.log = logging.getLogger('calm')
-
         super(MainHandler, self).__init__(*args, **kwargs)
 
-    def _get_query_args(self, handler_def):
-        """Retreives the values for query arguments."""
-        query_args = {}
-        for qarg in handler_def.query_args:
-            try:
-                query_args[qarg.name] = self.get_query_argument(qarg.name)
-            except MissingArgumentError:
-                if not qarg.required:
-                    continue
-
+    def _get_query_args(self, query_arg_plan, args):
+        """Retreives the values for query arguments into `args`."""
+        get_query_arguments = self.get_query_arguments
+        for name, required in query_arg_plan:
+            values = get_query_arguments(name)
+            if values:
+                args[name] = values[-1]
+            elif required:
                 raise BadRequestError(
-                    "Missing required query argument '{}'".format(qarg.name)
+                    "Missing required query argument '{}'".format(name)
                 )
 
-        return query_args
+    def _resolve_cast_plan(self, cast_plan):
+        """
+        Pairs every argument of `cast_plan` with its parser function.
 
-    def _cast_args(self, handler, args):
-        """Converts the request arguments to appropriate types."""
-        arg_types = handler.__annotations__
-        for arg in args:
-            arg_type = arg_types.get(arg)
+        Types the argument parser cannot resolve are left to its `parse`, so
+        they still fail only when such an argument is actually passed.
+        """
+        parser = self._argument_parser
+        parse_plan = []
+        for name, arg_type in cast_plan:
+            try:
+                parse = parser.resolve(arg_type)
+            except (DefinitionError, TypeError):
+                parse = partial(parser.parse, arg_type)
+
+            parse_plan.append((name, parse))
 
-            if not arg_type:
-                continue
+        return tuple(parse_plan)
 
-            args[arg] = self._argument_parser.parse(arg_type, args[arg])
+    def _cast_args(self, parse_plan, args):
+        """Converts the request arguments to appropriate types."""
+        for name, parse in parse_plan:
+            if name in args:
+                args[name] = parse(args[name])
 
     def _parse_and_update_body(self, handler_def):
         """Parses the request body to JSON."""
         if self.request.body:
             try:
-                json_body = json.loads(self.request.body.decode('utf-8'))
+                json_body = _loads(self.request.body.decode('utf-8'))
             except json.JSONDecodeError:
                 raise BadRequestError(
                     "Malformed request body. JSON is expected."
@@ -107,23 +133,59 @@ class MainHandler(RequestHandler):
 
             self.request.body = new_body
 
-    async def _handle_request(self, handler_def, **kwargs):
-        """A generic HTTP method handler."""
+    def _handle_request(self, handler_def, **kwargs):
+        """
+        A generic HTTP method handler.
+
+        Returns the awaitable of the handler's dispatcher, so that serving a
+        request does not add a coroutine level of its own.
+        """
         if not handler_def:
             raise MethodNotAllowedError()
 
+        return handler_def.dispatch(self, **kwargs)
+
+    @classmethod
+    def compile_dispatcher(cls, handler_def):
+        """
+        Builds a request dispatcher specialized for `handler_def`.
+
+        The handler, its argument plans and its coroutine flag are fixed at
+        registration time, so they are read from the definition once and
+        closed over. `consumes`, `produces` and `uri` are still read from the
+        definition per request, since the decorators may set them after the
+        route is registered. Should be called after the definition is
+        complete.
+        """
         handler = handler_def.handler
-        kwargs.update(self._get_query_args(handler_def))
-        self._cast_args(handler, kwargs)
-        self._parse_and_update_body(handler_def)
-        if inspect.iscoroutinefunction(handler):
-            resp = await handler(self.request, **kwargs)
-        else:
-            self.log.warning("'%s' is not a coroutine!", handler_def.handler)
-            resp = handler(self.request, **kwargs)
+        query_arg_plan = handler_def.query_arg_plan
+        cast_plan = handler_def.cast_plan
+        is_coroutine = handler_def.is_coroutine
+        parse_plans = {}  # argument parser -> resolved cast plan
+
+        async def dispatch(self, **kwargs):
+            """Serves a request with the `handler_def` handler."""
+            if query_arg_plan:
+                self._get_query_args(query_arg_plan, kwargs)
+            if cast_plan:
+                parser = self._argument_parser
+                parse_plan = parse_plans.get(parser)
+                if parse_plan is None:
+                    parse_plan = self._resolve_cast_plan(cast_plan)
+                    parse_plans[parser] = parse_plan
+
+                self._cast_args(parse_plan, kwargs)
+            self._parse_and_update_body(handler_def)
+            if is_coroutine:
+                resp = await handler(self.request, **kwargs)
+            else:
+                self.log.warning("'%s' is not a coroutine!", handler)
+                resp = handler(self.request, **kwargs)
+
+            if resp:
+                self._write_response(resp, handler_def)
 
-        if resp:
-            self._write_response(resp, handler_def)
+        return dispatch
 
     async def get(self, **kwargs):
         """The HTTP GET handler."""
@@ -159,7 +221,7 @@ class MainHandler(RequestHandler):
                                  handler_def.uri)
 
         try:
-            json_str = json.dumps(result)
+            payload = _dumps(result)
         except TypeError:
             raise ServerError(
                 "Could not serialize '{}' to JSON".format(
@@ -168,7 +230,7 @@ class MainHandler(RequestHandler):
             )
 
         self.set_header('Content-Type', 'application/json')
-        self.write(json_str)
+        self.write(payload)
         self.finish()
 
     def write_error(self, status_code, exc_info=None, **kwargs):
@@ -184,21 +246,16 @@ class MainHandler(RequestHandler):
     def _write_client_error(self, exc):
         """Formats and returns a client error to the client"""
         result = {
-            self._app.config['error_key']: exc.message or str(exc)
+            self._app.error_key: exc.message or str(exc)
         }
 
         self.set_status(exc.code)
-        self.write(json.dumps(result))
+        self.write(_dumps(result))
 
     def _write_server_error(self):
         """Formats and returns a server error to the client"""
-        result = {
-            self._app.config['error_key']: 'Oops our bad. '
-                                           'We are working to fix this!'
-        }
-
         self.set_status(500)
-        self.write(json.dumps(result))
+        self.write(_server_error_payload(self._app.error_key))
 
     def data_received(self, data):  # pragma: no cover
         """This is to ommit quality check errors."""
@@ -217,6 +274,55 @@ class DefaultHandler(MainHandler):
         raise NotFoundError()
 
 
+@lru_cache(maxsize=None)
+def _cached_signature(handler):
+    """
+    Returns the signature of `handler`, introspecting it only once.
+
+    If the handler already exposes a `__signature__`, it is used as is.
+    """
+    signature = getattr(handler, '__signature__', None)
+    if signature is None:
+        signature = inspect.signature(handler)
+
+    return signature
+
+
+def _handler_params(handler):
+    """
+    Returns the arguments of `handler`, except the first one.
+
+    The result maps the argument names, in order, to `(annotation, default)`
+    pairs, using `Parameter.empty` for the missing ones. Plain functions are
+    read directly from their code object, all the other callables fall back
+    to their signature.
+    """
+    code = getattr(handler, '__code__', None)
+    if (not inspect.isfunction(handler) or
+            hasattr(handler, '__wrapped__') or
+            hasattr(handler, '__signature__') or
+            code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)):
+        params = _cached_signature(handler).parameters.values()
+        return OrderedDict(
+            (p.name, (p.annotation, p.default))
+            for p in islice(params, 1, None)
+        )
+
+    names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    annotations = handler.__annotations__
+    defaults = dict(zip(
+        reversed(names[:code.co_argcount]),
+        reversed(handler.__defaults__ or ())
+    ))
+    defaults.update(handler.__kwdefaults__ or {})
+
+    return OrderedDict(
+        (name, (annotations.get(name, Parameter.empty),
+                defaults.get(name, Parameter.empty)))
+        for name in names[1:]
+    )
+
+
 class HandlerDef(object):
     """
     Defines a request handler.
@@ -226,18 +332,15 @@ class HandlerDef(object):
     """
     URI_REGEX = re.compile(r'\{([^\/\?\}]*)\}')
 
-    def __init__(self, uri, uri_regex, handler):
+    def __init__(self, uri, uri_regex, path_arg_names, handler):
         super(HandlerDef, self).__init__()
 
         self.uri = uri
         self.uri_regex = uri_regex
+        self.path_arg_names = path_arg_names
         self.handler = handler
-        self._signature = inspect.signature(handler)
-        self._params = {
-            k: v for k, v in list(
-                self._signature.parameters.items()
-            )[1:]
-        }
+        self.is_coroutine = inspect.iscoroutinefunction(handler)
+        self._params = _handler_params(handler)
 
         self.path_args = []
         self.query_args = []
@@ -246,18 +349,17 @@ class HandlerDef(object):
         self.produces = getattr(handler, 'produces', None)
         self.errors = getattr(handler, 'errors', [])
         self.deprecated = getattr(handler, 'deprecated', False)
+        self.dispatch = None
 
         self._extract_arguments()
         self.operation_definition = self._generate_operation_definition()
 
     def _extract_path_args(self):
         """Extracts path arguments from the URI."""
-        regex = re.compile(self.uri_regex)
-        path_arg_names = list(regex.groupindex.keys())
-
-        for arg_name in path_arg_names:
+        for arg_name in self.path_arg_names:
             if arg_name in self._params:
-                if self._params[arg_name].default is not Parameter.empty:
+                annotation, default = self._params[arg_name]
+                if default is not Parameter.empty:
                     raise DefinitionError(
                         "Path argument '{}' must not be optional in '{}'"
                         .format(
@@ -267,8 +369,7 @@ class HandlerDef(object):
                     )
 
                 self.path_args.append(
-                    PathParam(arg_name,
-                              self._params[arg_name].annotation)
+                    PathParam(arg_name, annotation)
                 )
             else:
                 raise DefinitionError(
@@ -284,19 +385,27 @@ class HandlerDef(object):
 
         Should be called after path arguments are extracted.
         """
-        for _, param in self._params.items():
-            if param.name not in [a.name for a in self.path_args]:
+        for name, (annotation, default) in self._params.items():
+            if name not in [a.name for a in self.path_args]:
                 self.query_args.append(
-                    QueryParam(param.name,
-                               param.annotation,
-                               param.default)
+                    QueryParam(name, annotation, default)
                 )
 
+        self.query_arg_plan = tuple(
+            (qarg.name, qarg.required) for qarg in self.query_args
+        )
+
     def _extract_arguments(self):
         """Extracts path and query arguments."""
         self._extract_path_args()
         self._extract_query_arguments()
 
+        self.cast_plan = tuple(
+            (name, annotation)
+            for name, (annotation, _) in self._params.items()
+            if annotation is not Parameter.empty
+        )
+
     def _generate_operation_definition(self):
         summary, description = parse_docstring(self.handler.__doc__ or '')
 
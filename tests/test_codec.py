@@ -30,3 +30,12 @@ class CodecTests(TestCase):
         self.assertTrue(parser.parse(bool, 'yes'))
         self.assertRaises(ArgumentParseError,
                           parser.parse, bool, 'womp')
+
+    def test_resolve(self):
+        custom_type = MagicMock()
+
+        parser = ArgumentParser()
+
+        self.assertIs(parser.resolve(int), parser.resolve(int))
+        self.assertIs(parser.resolve(custom_type), custom_type.parse)
+        self.assertRaises(DefinitionError, parser.resolve, tuple)
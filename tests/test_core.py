@@ -1,12 +1,16 @@
+import datetime
+import json
 from unittest.mock import patch
 
 from tornado.web import RequestHandler
 
 from calm.testing import CalmHTTPTestCase
 from calm import Application
-from calm.ex import DefinitionError, MethodNotAllowedError, NotFoundError
+from calm.ex import (DefinitionError, MethodNotAllowedError, NotFoundError,
+                     BadRequestError)
 from calm.resource import Resource, Integer, String
 from calm.decorator import produces, consumes
+from calm.handler import MainHandler
 
 
 app = Application('testapp', '1')
@@ -51,6 +55,10 @@ def response_manipulations(request, rtype):
         return ['test', 'result']
     elif rtype == 'dict':
         return {'test': 'result'}
+    elif rtype == 'numbers':
+        return {'big': 2 ** 70, 'nan': float('nan')}
+    elif rtype == 'datetime':
+        return datetime.datetime(2016, 1, 1)
     elif rtype == 'object':
         class jsonable():
             def __json__(self):
@@ -61,16 +69,50 @@ def response_manipulations(request, rtype):
         return object()
 
 
+class StructuredError(BadRequestError):
+    message = {'field': 'bad'}
+
+
+@app.get('/structured_error')
+def structured_error(request):
+    raise StructuredError()
+
+
 @app.get('/argtypes')
 def argument_types(request, arg1, arg2: int):
     return arg1, arg2
 
 
+@app.get('/unparsable')
+def unparsable_argument(request, arg: str = None):
+    return 'not parsed'
+
+
 @app.post('/json/body')
 def json_body(request):
     return request.body
 
 
+@app.post('/json/body/repr')
+def json_body_repr(request):
+    return {k: repr(v) for k, v in request.body.items()}
+
+
+class SomeResource(Resource):
+    someint = Integer()
+    somestr = String()
+
+
+@app.delete('/body/delete', consumes=SomeResource)
+def body_on_delete(request):
+    return [type(request.body).__name__, request.body.someint]
+
+
+@app.get('/body/get')
+def body_on_get(request):
+    return request.body
+
+
 custom_service = app.service('/custom')
 
 
@@ -80,11 +122,6 @@ class MyHandler(RequestHandler):
         self.write("custom result")
 
 
-class SomeResource(Resource):
-    someint = Integer()
-    somestr = String()
-
-
 @app.post('/input/output/validation')
 @produces(SomeResource)
 @consumes(SomeResource)
@@ -185,8 +222,22 @@ class CoreTests(CalmHTTPTestCase):
                   })
 
     def test_server_error(self):
+        error_key = self.get_calm_app().config['error_key']
+
         self.get('/blowup',
-                 expected_code=500)
+                 expected_code=500,
+                 expected_json_body={
+                     error_key: MainHandler.SERVER_ERROR_MESSAGE
+                 })
+
+    def test_client_error_body(self):
+        error_key = self.get_calm_app().config['error_key']
+
+        self.get('/structured_error',
+                 expected_code=400,
+                 expected_json_body={
+                     error_key: {'field': 'bad'}
+                 })
 
     def test_response_manipulations(self):
         self.delete('/response/str',
@@ -204,6 +255,13 @@ class CoreTests(CalmHTTPTestCase):
         self.delete('/response/error',
                     expected_code=500)
 
+        self.delete('/response/numbers',
+                    expected_body='{"big": 1180591620717411303424, '
+                                  '"nan": NaN}')
+
+        self.delete('/response/datetime',
+                    expected_code=500)
+
     def test_argument_types(self):
         args = {'arg1': 'something', 'arg2': 1234}
         expected = [args['arg1'], args['arg2']]
@@ -218,6 +276,14 @@ class CoreTests(CalmHTTPTestCase):
                  query_args=args,
                  expected_code=400)
 
+    def test_unparsable_argument(self):
+        self.get('/unparsable',
+                 expected_json_body='not parsed')
+
+        self.get('/unparsable',
+                 query_args={'arg': 'value'},
+                 expected_code=500)
+
     def test_json_body(self):
         expected = {
             'list': [
@@ -238,6 +304,34 @@ class CoreTests(CalmHTTPTestCase):
                   body='definitely not json',
                   expected_code=400)
 
+    def test_body_on_delete_and_get(self):
+        resp = self.fetch('/body/delete',
+                          method='DELETE',
+                          body='{"someint": 5, "somestr": "five"}',
+                          allow_nonstandard_methods=True)
+        self.assertEqual(resp.code, 200)
+        self.assertEqual(json.loads(resp.body.decode('utf-8')),
+                         ['SomeResource', 5])
+
+        resp = self.fetch('/body/get',
+                          method='GET',
+                          body='{"some": "json"}',
+                          allow_nonstandard_methods=True)
+        self.assertEqual(resp.code, 200)
+        self.assertEqual(json.loads(resp.body.decode('utf-8')),
+                         {'some': 'json'})
+
+    def test_json_body_numbers(self):
+        self.post('/json/body/repr',
+                  body='{"big": 123456789012345678901234567890, '
+                       '"nan": NaN, "inf": 1e400}',
+                  expected_code=200,
+                  expected_json_body={
+                      'big': '123456789012345678901234567890',
+                      'nan': 'nan',
+                      'inf': 'inf'
+                  })
+
     def test_configure(self):
         app = self.get_calm_app()
         old_config = app.config
@@ -253,6 +347,18 @@ class CoreTests(CalmHTTPTestCase):
 
         app.configure(**old_config)
 
+    def test_configure_isolation(self):
+        app1 = Application('app1', '1')
+        app2 = Application('app2', '1')
+        app1.configure(error_key='app1_error')
+
+        self.assertEqual(app1.error_key, 'app1_error')
+        self.assertEqual(app2.error_key, 'error')
+        self.assertEqual(app2.config['error_key'], 'error')
+
+        app2.config['error_key'] = 'app2_error'
+        self.assertEqual(app2.error_key, 'app2_error')
+
     def test_custom_handler(self):
         self.get('/custom/handler',
                  expected_code=200,
@@ -0,0 +1,107 @@
+import sys
+import inspect
+from functools import partial, wraps
+from unittest import TestCase, skipIf
+
+from calm.handler import _handler_params
+
+
+def signature_params(handler):
+    """What `_handler_params` is expected to return, via `inspect`."""
+    params = list(inspect.signature(handler).parameters.values())[1:]
+    return {p.name: (p.annotation, p.default) for p in params}
+
+
+def plain(request, arg1, arg2: int, arg3='default', arg4: bool = True):
+    pass
+
+
+def keyword_only(request, arg1, *, kwarg1: int, kwarg2='default'):
+    pass
+
+
+def positional_only():
+    """Built at runtime, the syntax is a `SyntaxError` before Python 3.8."""
+    namespace = {}
+    exec(
+        "def positional_only(request, arg1: int, /, arg2, arg3='default'):\n"
+        "    pass\n",
+        namespace
+    )
+
+    return namespace['positional_only']
+
+
+def var_args(request, arg1, *args, kwarg1=None, **kwargs):
+    pass
+
+
+def decorator(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@decorator
+def decorated(request, arg1: int, arg2='default'):
+    pass
+
+
+class SomeHandlers(object):
+    def method(self, request, arg1: int, arg2='default'):
+        pass
+
+
+class HandlerParamsTests(TestCase):
+    def assertMatchesSignature(self, handler):
+        self.assertEqual(_handler_params(handler), signature_params(handler))
+
+    def test_plain_function(self):
+        self.assertMatchesSignature(plain)
+        self.assertEqual(list(_handler_params(plain)),
+                         ['arg1', 'arg2', 'arg3', 'arg4'])
+
+    def test_keyword_only(self):
+        self.assertMatchesSignature(keyword_only)
+        self.assertEqual(_handler_params(keyword_only)['kwarg1'],
+                         (int, inspect.Parameter.empty))
+        self.assertEqual(_handler_params(keyword_only)['kwarg2'],
+                         (inspect.Parameter.empty, 'default'))
+
+    @skipIf(sys.version_info < (3, 8), "requires Python 3.8")
+    def test_positional_only(self):
+        self.assertMatchesSignature(positional_only())
+
+    def test_var_args(self):
+        self.assertMatchesSignature(var_args)
+        self.assertIn('args', _handler_params(var_args))
+        self.assertIn('kwargs', _handler_params(var_args))
+
+    def test_wrapped(self):
+        self.assertMatchesSignature(decorated)
+        self.assertEqual(list(_handler_params(decorated)), ['arg1', 'arg2'])
+
+    def test_explicit_signature(self):
+        def handler(request, arg1):
+            pass
+
+        handler.__signature__ = inspect.signature(plain)
+
+        self.assertMatchesSignature(handler)
+        self.assertEqual(list(_handler_params(handler)),
+                         ['arg1', 'arg2', 'arg3', 'arg4'])
+
+    def test_bound_method(self):
+        method = SomeHandlers().method
+
+        self.assertMatchesSignature(method)
+        self.assertEqual(list(_handler_params(method)), ['arg1', 'arg2'])
+
+    def test_partial(self):
+        handler = partial(plain, 'request')
+
+        self.assertMatchesSignature(handler)
+        self.assertEqual(list(_handler_params(handler)),
+                         ['arg2', 'arg3', 'arg4'])